@@ -103,7 +103,9 @@ def _create_query(node, context):
     output_columns = _get_output_columns(visited_nodes, context)
     filters = _get_filters(visited_nodes, context)
     selectable = sql_context_helpers.get_node_selectable(node, context)
-    query = select(output_columns).select_from(selectable).where(and_(*filters))
+    query = select(output_columns).select_from(selectable)
+    if filters:
+        query = query.where(and_(*filters))
     return query
 
 
@@ -171,18 +173,12 @@ def _expression_to_sql(expression, node, context):
     Returns:
         Expression, SQLAlchemy Expression equivalent to the passed compiler expression.
     """
-    _expression_transformers = {
-        expressions.LocalField: _transform_local_field_to_expression,
-        expressions.Variable: _transform_variable_to_expression,
-        expressions.Literal: _transform_literal_to_expression,
-        expressions.BinaryComposition: _transform_binary_composition_to_expression,
-    }
-    expression_type = type(expression)
-    if expression_type not in _expression_transformers:
+    expression_transformer = _EXPRESSION_TRANSFORMERS.get(type(expression))
+    if expression_transformer is None:
         raise NotImplementedError(
             u'Unsupported compiler expression "{}" of type "{}" cannot be converted to SQL '
             u'expression.'.format(expression, type(expression)))
-    return _expression_transformers[expression_type](expression, node, context)
+    return expression_transformer(expression, node, context)
 
 
 def _transform_binary_composition_to_expression(expression, node, context):
@@ -283,3 +279,13 @@ def _transform_local_field_to_expression(expression, node, context):
     column_name = expression.field_name
     column = sql_context_helpers.get_column(column_name, node, context)
     return column
+
+
+# Mapping from compiler expression type to the function transforming it into a SQLAlchemy
+# expression. Defined after all the transformer functions, since it refers to each of them.
+_EXPRESSION_TRANSFORMERS = {
+    expressions.LocalField: _transform_local_field_to_expression,
+    expressions.Variable: _transform_variable_to_expression,
+    expressions.Literal: _transform_literal_to_expression,
+    expressions.BinaryComposition: _transform_binary_composition_to_expression,
+}
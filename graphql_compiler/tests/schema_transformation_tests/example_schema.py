@@ -1,6 +1,7 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 from collections import OrderedDict
 
+from funcy import memoize
 from graphql import build_ast_schema, parse
 import six
 
@@ -36,28 +37,33 @@ type SchemaQuery {
 '''
 
 
-basic_merged_schema = merge_schemas(
-    OrderedDict([
-        ('first', basic_schema),
-        ('second', parse(basic_additional_schema)),
-    ]),
-    [
-        CrossSchemaEdgeDescriptor(
-            edge_name='Animal_Creature',
-            outbound_field_reference=FieldReference(
-                schema_id='first',
-                type_name='Animal',
-                field_name='uuid',
+# Merging schemas is comparatively expensive, so each merged schema below is only built the first
+# time it is requested, and then shared by all tests that use it.
+@memoize
+def get_basic_merged_schema():
+    """Return the merged schema of basic_schema and basic_additional_schema."""
+    return merge_schemas(
+        OrderedDict([
+            ('first', basic_schema),
+            ('second', parse(basic_additional_schema)),
+        ]),
+        [
+            CrossSchemaEdgeDescriptor(
+                edge_name='Animal_Creature',
+                outbound_field_reference=FieldReference(
+                    schema_id='first',
+                    type_name='Animal',
+                    field_name='uuid',
+                ),
+                inbound_field_reference=FieldReference(
+                    schema_id='second',
+                    type_name='Creature',
+                    field_name='id'
+                ),
+                out_edge_only=False,
             ),
-            inbound_field_reference=FieldReference(
-                schema_id='second',
-                type_name='Creature',
-                field_name='id'
-            ),
-            out_edge_only=False,
-        ),
-    ],
-)
+        ],
+    )
 
 
 interface_additional_schema = '''
@@ -90,28 +96,31 @@ type SchemaQuery {
 '''
 
 
-interface_merged_schema = merge_schemas(
-    OrderedDict([
-        ('first', basic_schema),
-        ('second', parse(interface_additional_schema)),
-    ]),
-    [
-        CrossSchemaEdgeDescriptor(
-            edge_name='Animal_Creature',
-            outbound_field_reference=FieldReference(
-                schema_id='first',
-                type_name='Animal',
-                field_name='uuid',
-            ),
-            inbound_field_reference=FieldReference(
-                schema_id='second',
-                type_name='Creature',
-                field_name='id'
+@memoize
+def get_interface_merged_schema():
+    """Return the merged schema of basic_schema and interface_additional_schema."""
+    return merge_schemas(
+        OrderedDict([
+            ('first', basic_schema),
+            ('second', parse(interface_additional_schema)),
+        ]),
+        [
+            CrossSchemaEdgeDescriptor(
+                edge_name='Animal_Creature',
+                outbound_field_reference=FieldReference(
+                    schema_id='first',
+                    type_name='Animal',
+                    field_name='uuid',
+                ),
+                inbound_field_reference=FieldReference(
+                    schema_id='second',
+                    type_name='Creature',
+                    field_name='id'
+                ),
+                out_edge_only=False,
             ),
-            out_edge_only=False,
-        ),
-    ],
-)
+        ],
+    )
 
 
 def _get_type_equivalence_hints(schema_id_to_ast, type_equivalence_hints_names):
@@ -166,26 +175,29 @@ union_schema_id_to_ast = OrderedDict([
 ])
 
 
-union_merged_schema = merge_schemas(
-    union_schema_id_to_ast,
-    [
-        CrossSchemaEdgeDescriptor(
-            edge_name='Animal_Creature',
-            outbound_field_reference=FieldReference(
-                schema_id='first',
-                type_name='Animal',
-                field_name='uuid',
-            ),
-            inbound_field_reference=FieldReference(
-                schema_id='second',
-                type_name='Creature',
-                field_name='id'
+@memoize
+def get_union_merged_schema():
+    """Return the merged schema of basic_schema and union_additional_schema."""
+    return merge_schemas(
+        union_schema_id_to_ast,
+        [
+            CrossSchemaEdgeDescriptor(
+                edge_name='Animal_Creature',
+                outbound_field_reference=FieldReference(
+                    schema_id='first',
+                    type_name='Animal',
+                    field_name='uuid',
+                ),
+                inbound_field_reference=FieldReference(
+                    schema_id='second',
+                    type_name='Creature',
+                    field_name='id'
+                ),
+                out_edge_only=False,
             ),
-            out_edge_only=False,
-        ),
-    ],
-    _get_type_equivalence_hints(union_schema_id_to_ast, {'Creature': 'CreatureOrCat'})
-)
+        ],
+        _get_type_equivalence_hints(union_schema_id_to_ast, {'Creature': 'CreatureOrCat'})
+    )
 
 
 third_additional_schema = '''
@@ -204,43 +216,46 @@ type SchemaQuery {
 '''
 
 
-three_merged_schema = merge_schemas(
-    OrderedDict([
-        ('first', basic_schema),
-        ('second', parse(basic_additional_schema)),
-        ('third', parse(third_additional_schema)),
-    ]),
-    [
-        CrossSchemaEdgeDescriptor(
-            edge_name='Animal_Creature',
-            outbound_field_reference=FieldReference(
-                schema_id='first',
-                type_name='Animal',
-                field_name='uuid',
-            ),
-            inbound_field_reference=FieldReference(
-                schema_id='second',
-                type_name='Creature',
-                field_name='id'
+@memoize
+def get_three_merged_schema():
+    """Return the merged schema of basic, basic_additional and third_additional schemas."""
+    return merge_schemas(
+        OrderedDict([
+            ('first', basic_schema),
+            ('second', parse(basic_additional_schema)),
+            ('third', parse(third_additional_schema)),
+        ]),
+        [
+            CrossSchemaEdgeDescriptor(
+                edge_name='Animal_Creature',
+                outbound_field_reference=FieldReference(
+                    schema_id='first',
+                    type_name='Animal',
+                    field_name='uuid',
+                ),
+                inbound_field_reference=FieldReference(
+                    schema_id='second',
+                    type_name='Creature',
+                    field_name='id'
+                ),
+                out_edge_only=False,
             ),
-            out_edge_only=False,
-        ),
-        CrossSchemaEdgeDescriptor(
-            edge_name='Animal_Critter',
-            outbound_field_reference=FieldReference(
-                schema_id='first',
-                type_name='Animal',
-                field_name='uuid',
+            CrossSchemaEdgeDescriptor(
+                edge_name='Animal_Critter',
+                outbound_field_reference=FieldReference(
+                    schema_id='first',
+                    type_name='Animal',
+                    field_name='uuid',
+                ),
+                inbound_field_reference=FieldReference(
+                    schema_id='third',
+                    type_name='Critter',
+                    field_name='ID'
+                ),
+                out_edge_only=False,
             ),
-            inbound_field_reference=FieldReference(
-                schema_id='third',
-                type_name='Critter',
-                field_name='ID'
-            ),
-            out_edge_only=False,
-        ),
-    ],
-)
+        ],
+    )
 
 
 stitch_arguments_flipped_schema_str = '''
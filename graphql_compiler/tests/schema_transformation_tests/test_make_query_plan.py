@@ -6,7 +6,7 @@ from graphql import parse, print_ast
 
 from ...schema_transformation.make_query_plan import make_query_plan
 from ...schema_transformation.split_query import split_query
-from .example_schema import basic_merged_schema
+from .example_schema import get_basic_merged_schema
 
 
 class TestMakeQueryPlan(unittest.TestCase):
@@ -44,7 +44,7 @@ class TestMakeQueryPlan(unittest.TestCase):
               }
             }
         ''')
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
+        query_node, intermediate_outputs = split_query(parse(query_str), get_basic_merged_schema())
         query_plan_descriptor = make_query_plan(query_node, intermediate_outputs)
         # Check the child ASTs in the input query node are unchanged (@filter not added))
         child_query_node = query_node.child_query_connections[0].sink_query_node
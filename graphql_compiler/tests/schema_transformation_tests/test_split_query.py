@@ -1,16 +1,18 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 from collections import namedtuple
+import copy
 from textwrap import dedent
 import unittest
 
 from graphql import parse, print_ast
+from parameterized import parameterized
 import six
 
 from ...exceptions import GraphQLValidationError
 from ...schema_transformation.split_query import split_query
 from .example_schema import (
-    basic_merged_schema, interface_merged_schema, stitch_arguments_flipped_schema,
-    three_merged_schema, union_merged_schema
+    get_basic_merged_schema, get_interface_merged_schema, get_three_merged_schema,
+    get_union_merged_schema, stitch_arguments_flipped_schema
 )
 
 
@@ -20,13 +22,913 @@ ExpectedQueryNode = namedtuple(
         'query_str',
         'schema_id',
         'child_query_nodes_and_out_names',
-        # List[Tuple[ExpectedQueryNode, str, str]]
+        # Tuple[Tuple[ExpectedQueryNode, str, str], ...]
         # child expected query node, parent out name, child out name
     )
 )
 
 
+NO_SPLIT_QUERY_STR = dedent('''\
+    {
+      Animal {
+        name @output(out_name: "name")
+      }
+    }
+''')
+
+
+NO_SPLIT_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=NO_SPLIT_QUERY_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=()
+)
+
+
+NO_EXISTING_FIELDS_SPLIT_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+NO_EXISTING_FIELDS_SPLIT_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+NO_EXISTING_FIELDS_SPLIT_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+NO_EXISTING_FIELDS_SPLIT_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=NO_EXISTING_FIELDS_SPLIT_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=NO_EXISTING_FIELDS_SPLIT_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+STITCH_ARGUMENTS_FLIPPED_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+STITCH_ARGUMENTS_FLIPPED_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+STITCH_ARGUMENTS_FLIPPED_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+STITCH_ARGUMENTS_FLIPPED_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=STITCH_ARGUMENTS_FLIPPED_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=STITCH_ARGUMENTS_FLIPPED_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+ORIGINAL_UNMODIFIED_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_PARENT_QUERY_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "result")
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_PARENT_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "result")
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_PARENT_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_PARENT_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=EXISTING_OUTPUT_FIELD_IN_PARENT_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=EXISTING_OUTPUT_FIELD_IN_PARENT_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            'result',
+            '__intermediate_output_0',
+        ),
+    )
+)
+
+
+EXISTING_OUTPUT_FIELD_IN_CHILD_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          id @output(out_name: "result")
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_CHILD_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_CHILD_CHILD_STR = dedent('''\
+    {
+      Creature {
+        id @output(out_name: "result")
+        age @output(out_name: "age")
+      }
+    }
+''')
+
+
+EXISTING_OUTPUT_FIELD_IN_CHILD_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=EXISTING_OUTPUT_FIELD_IN_CHILD_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=EXISTING_OUTPUT_FIELD_IN_CHILD_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            'result',
+        ),
+    )
+)
+
+
+EXISTING_FIELD_IN_BOTH_QUERY_STR = dedent('''\
+    {
+      Animal {
+        uuid @filter(op_name: "in_collection", value: ["$uuids"])
+        out_Animal_Creature {
+          id @output(out_name: "result")
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_FIELD_IN_BOTH_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @filter(op_name: "in_collection", value: ["$uuids"]) \
+@output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+EXISTING_FIELD_IN_BOTH_CHILD_STR = dedent('''\
+    {
+      Creature {
+        id @output(out_name: "result")
+        age @output(out_name: "age")
+      }
+    }
+''')
+
+
+EXISTING_FIELD_IN_BOTH_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=EXISTING_FIELD_IN_BOTH_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=EXISTING_FIELD_IN_BOTH_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            'result',
+        ),
+    )
+)
+
+
+NESTED_QUERY_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_ParentOf {
+          color @output(out_name: "color")
+          out_Animal_Creature {
+            age @output(out_name: "age1")
+            friend {
+              age @output(out_name: "age2")
+            }
+          }
+        }
+      }
+    }
+''')
+
+
+NESTED_QUERY_PARENT_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_ParentOf {
+          color @output(out_name: "color")
+          uuid @output(out_name: "__intermediate_output_0")
+        }
+      }
+    }
+''')
+
+
+NESTED_QUERY_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age1")
+        id @output(out_name: "__intermediate_output_1")
+        friend {
+          age @output(out_name: "age2")
+        }
+      }
+    }
+''')
+
+
+NESTED_QUERY_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=NESTED_QUERY_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=NESTED_QUERY_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+EXISTING_OPTIONAL_ON_EDGE_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature @optional {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @optional @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_QUERY_STR = dedent('''\
+    {
+      Animal {
+        uuid @optional @filter(op_name: "=", value: ["$uuid_to_select"])
+        out_Animal_Creature @optional {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @optional @filter(op_name: "=", value: ["$uuid_to_select"]) \
+@output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+EXISTING_OPTIONAL_ON_EDGE_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=EXISTING_OPTIONAL_ON_EDGE_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=EXISTING_OPTIONAL_ON_EDGE_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+TYPE_COERCION_BEFORE_EDGE_QUERY_STR = dedent('''\
+    {
+      Entity {
+        ... on Animal {
+          out_Animal_Creature {
+            age @output(out_name: "age")
+          }
+        }
+      }
+    }
+''')
+
+
+TYPE_COERCION_BEFORE_EDGE_PARENT_STR = dedent('''\
+    {
+      Entity {
+        ... on Animal {
+          uuid @output(out_name: "__intermediate_output_0")
+        }
+      }
+    }
+''')
+
+
+TYPE_COERCION_BEFORE_EDGE_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+TYPE_COERCION_BEFORE_EDGE_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=TYPE_COERCION_BEFORE_EDGE_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=TYPE_COERCION_BEFORE_EDGE_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+TYPE_COERCION_AFTER_EDGE_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          ... on Cat {
+            age @output(out_name: "age")
+          }
+        }
+      }
+    }
+''')
+
+
+TYPE_COERCION_AFTER_EDGE_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+TYPE_COERCION_AFTER_EDGE_CHILD_STR = dedent('''\
+    {
+      Cat {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+TYPE_COERCION_AFTER_EDGE_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=TYPE_COERCION_AFTER_EDGE_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=TYPE_COERCION_AFTER_EDGE_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+TWO_CHILDREN_STITCH_ON_SAME_FIELD_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_Creature {
+          age @output(out_name: "age1")
+        }
+        out_Animal_ParentOf {
+          out_Animal_Creature {
+            age @output(out_name: "age2")
+          }
+        }
+      }
+    }
+''')
+
+
+TWO_CHILDREN_STITCH_ON_SAME_FIELD_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+        out_Animal_ParentOf {
+          uuid @output(out_name: "__intermediate_output_2")
+        }
+      }
+    }
+''')
+
+
+TWO_CHILDREN_STITCH_ON_SAME_FIELD_CHILD_STR1 = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age1")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+TWO_CHILDREN_STITCH_ON_SAME_FIELD_CHILD_STR2 = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age2")
+        id @output(out_name: "__intermediate_output_3")
+      }
+    }
+''')
+
+
+TWO_CHILDREN_STITCH_ON_SAME_FIELD_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=TWO_CHILDREN_STITCH_ON_SAME_FIELD_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=TWO_CHILDREN_STITCH_ON_SAME_FIELD_CHILD_STR1,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+        (
+            ExpectedQueryNode(
+                query_str=TWO_CHILDREN_STITCH_ON_SAME_FIELD_CHILD_STR2,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_2',
+            '__intermediate_output_3',
+        ),
+    )
+)
+
+
+CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_QUERY_STR = dedent('''\
+    {
+      Animal {
+        out_Animal_ParentOf {
+          color @output(out_name: "color")
+        }
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+      }
+    }
+''')
+
+
+CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_PARENT_STR = dedent('''\
+    {
+      Animal {
+        uuid @output(out_name: "__intermediate_output_0")
+        out_Animal_ParentOf {
+          color @output(out_name: "color")
+        }
+      }
+    }
+''')
+
+
+CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_CHILD_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_CHILD_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_V_QUERY_STR = dedent('''\
+    {
+      Animal {
+        name
+        out_Animal_Creature {
+          age @output(out_name: "age")
+        }
+        out_Animal_Critter {
+          size @output(out_name: "size")
+        }
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_V_PARENT_STR = dedent('''\
+    {
+      Animal {
+        name
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_V_CHILD1_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_V_CHILD2_STR = dedent('''\
+    {
+      Critter {
+        size @output(out_name: "size")
+        ID @output(out_name: "__intermediate_output_2")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_V_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=TWO_EDGES_ON_SAME_FIELD_IN_V_PARENT_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=TWO_EDGES_ON_SAME_FIELD_IN_V_CHILD1_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+        (
+            ExpectedQueryNode(
+                query_str=TWO_EDGES_ON_SAME_FIELD_IN_V_CHILD2_STR,
+                schema_id='third',
+                child_query_nodes_and_out_names=()
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_2',
+        ),
+    )
+)
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_QUERY_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        in_Animal_Creature {
+          name @output(out_name: "name")
+          out_Animal_Critter {
+            size @output(out_name: "size")
+          }
+        }
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_PARENT_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_CHILD1_STR = dedent('''\
+    {
+      Animal {
+        name @output(out_name: "name")
+        uuid @output(out_name: "__intermediate_output_1")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_CHILD2_STR = dedent('''\
+    {
+      Critter {
+        size @output(out_name: "size")
+        ID @output(out_name: "__intermediate_output_2")
+      }
+    }
+''')
+
+
+TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_PARENT_STR,
+    schema_id='second',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_CHILD1_STR,
+                schema_id='first',
+                child_query_nodes_and_out_names=(
+                    (
+                        ExpectedQueryNode(
+                            query_str=TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_CHILD2_STR,
+                            schema_id='third',
+                            child_query_nodes_and_out_names=()
+                        ),
+                        '__intermediate_output_1',
+                        '__intermediate_output_2',
+                    ),
+                )
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
+COMPLEX_QUERY_STRUCTURE_QUERY_STR = dedent('''\
+    {
+      Animal {
+        color @output(out_name: "color")
+        out_Animal_Creature {
+          age @output(out_name: "age")
+          in_Animal_Creature {
+            description @output(out_name: "description")
+          }
+          friend {
+            in_Animal_Creature {
+              description @output(out_name: "friend_description")
+            }
+          }
+        }
+      }
+    }
+''')
+
+
+COMPLEX_QUERY_STRUCTURE_QUERY_PIECE1_STR = dedent('''\
+    {
+      Animal {
+        color @output(out_name: "color")
+        uuid @output(out_name: "__intermediate_output_0")
+      }
+    }
+''')
+
+
+COMPLEX_QUERY_STRUCTURE_QUERY_PIECE2_STR = dedent('''\
+    {
+      Creature {
+        age @output(out_name: "age")
+        id @output(out_name: "__intermediate_output_1")
+        friend {
+          id @output(out_name: "__intermediate_output_3")
+        }
+      }
+    }
+''')
+
+
+COMPLEX_QUERY_STRUCTURE_QUERY_PIECE3_STR = dedent('''\
+    {
+      Animal {
+        description @output(out_name: "description")
+        uuid @output(out_name: "__intermediate_output_2")
+      }
+    }
+''')
+
+
+COMPLEX_QUERY_STRUCTURE_QUERY_PIECE4_STR = dedent('''\
+    {
+      Animal {
+        description @output(out_name: "friend_description")
+        uuid @output(out_name: "__intermediate_output_4")
+      }
+    }
+''')
+
+
+COMPLEX_QUERY_STRUCTURE_EXPECTED_QUERY_NODE = ExpectedQueryNode(
+    query_str=COMPLEX_QUERY_STRUCTURE_QUERY_PIECE1_STR,
+    schema_id='first',
+    child_query_nodes_and_out_names=(
+        (
+            ExpectedQueryNode(
+                query_str=COMPLEX_QUERY_STRUCTURE_QUERY_PIECE2_STR,
+                schema_id='second',
+                child_query_nodes_and_out_names=(
+                    (
+                        ExpectedQueryNode(
+                            query_str=COMPLEX_QUERY_STRUCTURE_QUERY_PIECE3_STR,
+                            schema_id='first',
+                            child_query_nodes_and_out_names=()
+                        ),
+                        '__intermediate_output_1',
+                        '__intermediate_output_2',
+                    ),
+                    (
+                        ExpectedQueryNode(
+                            query_str=COMPLEX_QUERY_STRUCTURE_QUERY_PIECE4_STR,
+                            schema_id='first',
+                            child_query_nodes_and_out_names=()
+                        ),
+                        '__intermediate_output_3',
+                        '__intermediate_output_4',
+                    ),
+                )
+            ),
+            '__intermediate_output_0',
+            '__intermediate_output_1',
+        ),
+    )
+)
+
+
 class TestSplitQuery(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Bind the merged schemas once for all tests."""
+        cls.basic_merged_schema = get_basic_merged_schema()
+        cls.interface_merged_schema = get_interface_merged_schema()
+        cls.union_merged_schema = get_union_merged_schema()
+        cls.three_merged_schema = get_three_merged_schema()
+        cls.stitch_arguments_flipped_schema = stitch_arguments_flipped_schema
+
     def _check_query_node_structure(self, root_query_node, root_expected_query_node):
         """Check root_query_node has no parent and has the same structure as the expected input."""
         self.assertIsNone(root_query_node.parent_query_connection)
@@ -34,38 +936,48 @@ class TestSplitQuery(unittest.TestCase):
 
     def _check_query_node_structure_helper(self, query_node, expected_query_node):
         """Check query_node has the same structure as expected_query_node."""
-        # Check AST and id of the parent
-        self.assertEqual(print_ast(query_node.query_ast), expected_query_node.query_str)
-        self.assertEqual(query_node.schema_id, expected_query_node.schema_id)
-        # Check number of children matches
-        child_query_connections = query_node.child_query_connections
-        expected_child_data = expected_query_node.child_query_nodes_and_out_names
-        self.assertEqual(len(child_query_connections), len(expected_child_data))
-        for i, (child_query_connection, expected_child_data_piece) in enumerate(
-            six.moves.zip(child_query_connections, expected_child_data)
-        ):
-            # Check child and parent connections
-            child_query_node = child_query_connection.sink_query_node
-            child_expected_query_node, parent_out_name, child_out_name = expected_child_data_piece
-            self._check_query_node_edge(query_node, i, child_query_node, parent_out_name,
-                                        child_out_name)
-            # Recurse
-            self._check_query_node_structure_helper(child_query_node, child_expected_query_node)
-
-    def _check_query_node_edge(self, parent_query_node, parent_to_child_edge_index,
-                               child_query_node, parent_out_name, child_out_name):
+        # Walk both trees with an explicit stack of (query_node, expected_query_node) pairs
+        nodes_to_check = [(query_node, expected_query_node)]
+        while nodes_to_check:
+            current_query_node, current_expected_query_node = nodes_to_check.pop()
+            # Check AST and id of the parent
+            self.assertEqual(print_ast(current_query_node.query_ast),
+                             current_expected_query_node.query_str)
+            self.assertEqual(current_query_node.schema_id, current_expected_query_node.schema_id)
+            # Check number of children matches
+            child_query_connections = current_query_node.child_query_connections
+            expected_child_data = current_expected_query_node.child_query_nodes_and_out_names
+            self.assertEqual(len(child_query_connections), len(expected_child_data))
+            for child_query_connection, expected_child_data_piece in six.moves.zip(
+                child_query_connections, expected_child_data
+            ):
+                # Check child and parent connections
+                child_expected_query_node, parent_out_name, child_out_name = (
+                    expected_child_data_piece
+                )
+                self._check_query_node_edge(current_query_node, child_query_connection,
+                                            parent_out_name, child_out_name)
+                nodes_to_check.append(
+                    (child_query_connection.sink_query_node, child_expected_query_node)
+                )
+
+    def _check_query_node_edge(self, parent_query_node, parent_to_child_connection,
+                               parent_out_name, child_out_name):
         """Check the edge between parent and child is symmetric, with the right output names."""
-        parent_to_child_connection = parent_query_node.child_query_connections[
-            parent_to_child_edge_index
-        ]
+        child_query_node = parent_to_child_connection.sink_query_node
         child_to_parent_connection = child_query_node.parent_query_connection
 
-        self.assertIs(parent_to_child_connection.sink_query_node, child_query_node)
         self.assertIs(child_to_parent_connection.sink_query_node, parent_query_node)
-        self.assertEqual(parent_to_child_connection.source_field_out_name, parent_out_name)
-        self.assertEqual(child_to_parent_connection.sink_field_out_name, parent_out_name)
-        self.assertEqual(parent_to_child_connection.sink_field_out_name, child_out_name)
-        self.assertEqual(child_to_parent_connection.source_field_out_name, child_out_name)
+        self.assertEqual(
+            (parent_to_child_connection.source_field_out_name,
+             parent_to_child_connection.sink_field_out_name),
+            (parent_out_name, child_out_name)
+        )
+        self.assertEqual(
+            (child_to_parent_connection.sink_field_out_name,
+             child_to_parent_connection.source_field_out_name),
+            (parent_out_name, child_out_name)
+        )
 
     def _get_intermediate_outputs_set(self, number_of_outputs):
         output_names = set(
@@ -73,933 +985,185 @@ class TestSplitQuery(unittest.TestCase):
         )
         return frozenset(output_names)
 
-    def test_no_split(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                name @output(out_name: "name")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=query_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[]
+    @parameterized.expand([
+        (
+            'no_split',
+            NO_SPLIT_QUERY_STR,
+            'basic_merged_schema',
+            NO_SPLIT_EXPECTED_QUERY_NODE,
+            0,
+        ),
+        (
+            'no_existing_fields_split',
+            NO_EXISTING_FIELDS_SPLIT_QUERY_STR,
+            'basic_merged_schema',
+            NO_EXISTING_FIELDS_SPLIT_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'stitch_arguments_flipped',
+            STITCH_ARGUMENTS_FLIPPED_QUERY_STR,
+            'stitch_arguments_flipped_schema',
+            STITCH_ARGUMENTS_FLIPPED_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'existing_output_field_in_parent',
+            EXISTING_OUTPUT_FIELD_IN_PARENT_QUERY_STR,
+            'basic_merged_schema',
+            EXISTING_OUTPUT_FIELD_IN_PARENT_EXPECTED_QUERY_NODE,
+            1,
+        ),
+        (
+            'existing_output_field_in_child',
+            EXISTING_OUTPUT_FIELD_IN_CHILD_QUERY_STR,
+            'basic_merged_schema',
+            EXISTING_OUTPUT_FIELD_IN_CHILD_EXPECTED_QUERY_NODE,
+            1,
+        ),
+        (
+            'existing_field_in_both',
+            EXISTING_FIELD_IN_BOTH_QUERY_STR,
+            'basic_merged_schema',
+            EXISTING_FIELD_IN_BOTH_EXPECTED_QUERY_NODE,
+            1,
+        ),
+        (
+            'nested_query',
+            NESTED_QUERY_QUERY_STR,
+            'basic_merged_schema',
+            NESTED_QUERY_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'existing_optional_on_edge',
+            EXISTING_OPTIONAL_ON_EDGE_QUERY_STR,
+            'basic_merged_schema',
+            EXISTING_OPTIONAL_ON_EDGE_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'existing_optional_on_edge_and_field',
+            EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_QUERY_STR,
+            'basic_merged_schema',
+            EXISTING_OPTIONAL_ON_EDGE_AND_FIELD_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'type_coercion_before_edge',
+            TYPE_COERCION_BEFORE_EDGE_QUERY_STR,
+            'basic_merged_schema',
+            TYPE_COERCION_BEFORE_EDGE_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'interface_type_coercion_after_edge',
+            TYPE_COERCION_AFTER_EDGE_QUERY_STR,
+            'interface_merged_schema',
+            TYPE_COERCION_AFTER_EDGE_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'union_type_coercion_after_edge',
+            TYPE_COERCION_AFTER_EDGE_QUERY_STR,
+            'union_merged_schema',
+            TYPE_COERCION_AFTER_EDGE_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'two_children_stitch_on_same_field',
+            TWO_CHILDREN_STITCH_ON_SAME_FIELD_QUERY_STR,
+            'basic_merged_schema',
+            TWO_CHILDREN_STITCH_ON_SAME_FIELD_EXPECTED_QUERY_NODE,
+            4,
+        ),
+        (
+            'cross_schema_edge_field_after_normal_vertex_field',
+            CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_QUERY_STR,
+            'basic_merged_schema',
+            CROSS_SCHEMA_EDGE_FIELD_AFTER_NORMAL_VERTEX_FIELD_EXPECTED_QUERY_NODE,
+            2,
+        ),
+        (
+            'two_edges_on_same_field_in_V',
+            TWO_EDGES_ON_SAME_FIELD_IN_V_QUERY_STR,
+            'three_merged_schema',
+            TWO_EDGES_ON_SAME_FIELD_IN_V_EXPECTED_QUERY_NODE,
+            3,
+        ),
+        (
+            'two_edges_on_same_field_in_chain',
+            TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_QUERY_STR,
+            'three_merged_schema',
+            TWO_EDGES_ON_SAME_FIELD_IN_CHAIN_EXPECTED_QUERY_NODE,
+            3,
+        ),
+        (
+            'complex_query_structure',
+            COMPLEX_QUERY_STRUCTURE_QUERY_STR,
+            'basic_merged_schema',
+            COMPLEX_QUERY_STRUCTURE_EXPECTED_QUERY_NODE,
+            5,
+        ),
+    ])
+    def test_split_query(self, _, query_str, merged_schema_name, expected_query_node,
+                         number_of_intermediate_outputs):
+        query_node, intermediate_outputs = split_query(
+            parse(query_str), getattr(self, merged_schema_name)
         )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
         self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(0))
+        self.assertEqual(intermediate_outputs,
+                         self._get_intermediate_outputs_set(number_of_intermediate_outputs))
 
-    def test_no_existing_fields_split(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
+    def test_original_unmodified(self):
+        query_ast = parse(ORIGINAL_UNMODIFIED_QUERY_STR)
+        expected_query_ast = copy.deepcopy(query_ast)
+        split_query(query_ast, self.basic_merged_schema)
+        self.assertEqual(query_ast, expected_query_ast)
 
-    def test_stitch_arguments_flipped(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-              }
+
+UNSUPPORTED_DIRECTIVES_QUERY_STRS = (
+    dedent('''\
+        {
+          Animal {
+            color @tag(tag_name: "color")
+            out_Animal_ParentOf {
+              color @filter(op_name: "=", value: ["%color"])
+                    @output(out_name: "result")
             }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
+          }
+        }
+    '''),
+    dedent('''\
+        {
+          Animal @fold {
+            color @output(out_name: "result")
+          }
+        }
+    '''),
+    dedent('''\
+        {
+          Animal {
+            out_Animal_ParentOf @recurse(depth: 1) {
+              color @output(out_name: "result")
             }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(
-            parse(query_str), stitch_arguments_flipped_schema
-        )
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_original_unmodified(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        query_ast = parse(query_str)
-        split_query(query_ast, basic_merged_schema)
-        self.assertEqual(query_ast, parse(query_str))
-
-    def test_existing_output_field_in_parent(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "result")
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "result")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    'result',
-                    '__intermediate_output_0',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(1))
-
-    def test_existing_output_field_in_child(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  id @output(out_name: "result")
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                id @output(out_name: "result")
-                age @output(out_name: "age")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    'result',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(1))
-
-    def test_existing_field_in_both(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                uuid @filter(op_name: "in_collection", value: ["$uuids"])
-                out_Animal_Creature {
-                  id @output(out_name: "result")
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @filter(op_name: "in_collection", value: ["$uuids"]) \
-@output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                id @output(out_name: "result")
-                age @output(out_name: "age")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    'result',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(1))
-
-    def test_nested_query(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_ParentOf {
-                  color @output(out_name: "color")
-                  out_Animal_Creature {
-                    age @output(out_name: "age1")
-                    friend {
-                      age @output(out_name: "age2")
-                    }
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                out_Animal_ParentOf {
-                  color @output(out_name: "color")
-                  uuid @output(out_name: "__intermediate_output_0")
-                }
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age1")
-                id @output(out_name: "__intermediate_output_1")
-                friend {
-                  age @output(out_name: "age2")
-                }
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_existing_optional_on_edge(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature @optional {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @optional @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_existing_optional_on_edge_and_field(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                uuid @optional @filter(op_name: "=", value: ["$uuid_to_select"])
-                out_Animal_Creature @optional {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @optional @filter(op_name: "=", value: ["$uuid_to_select"]) \
-@output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_type_coercion_before_edge(self):
-        query_str = dedent('''\
-            {
-              Entity {
-                ... on Animal {
-                  out_Animal_Creature {
-                    age @output(out_name: "age")
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Entity {
-                ... on Animal {
-                  uuid @output(out_name: "__intermediate_output_0")
-                }
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_interface_type_coercion_after_edge(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  ... on Cat {
-                    age @output(out_name: "age")
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Cat {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), interface_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_union_type_coercion_after_edge(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  ... on Cat {
-                    age @output(out_name: "age")
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Cat {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), union_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_two_children_stitch_on_same_field(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_Creature {
-                  age @output(out_name: "age1")
-                }
-                out_Animal_ParentOf {
-                  out_Animal_Creature {
-                    age @output(out_name: "age2")
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-                out_Animal_ParentOf {
-                  uuid @output(out_name: "__intermediate_output_2")
-                }
-              }
-            }
-        ''')
-        child_str1 = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age1")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        child_str2 = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age2")
-                id @output(out_name: "__intermediate_output_3")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str1,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                ),
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str2,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_2',
-                    '__intermediate_output_3',
-                ),
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(4))
-
-    def test_cross_schema_edge_field_after_normal_vertex_field(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_ParentOf {
-                  color @output(out_name: "color")
-                }
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                uuid @output(out_name: "__intermediate_output_0")
-                out_Animal_ParentOf {
-                  color @output(out_name: "color")
-                }
-              }
-            }
-        ''')
-        child_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(2))
-
-    def test_two_edges_on_same_field_in_V(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                name
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                }
-                out_Animal_Critter {
-                  size @output(out_name: "size")
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Animal {
-                name
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child1_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-        child2_str = dedent('''\
-            {
-              Critter {
-                size @output(out_name: "size")
-                ID @output(out_name: "__intermediate_output_2")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child1_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                ),
-                (
-                    ExpectedQueryNode(
-                        query_str=child2_str,
-                        schema_id='third',
-                        child_query_nodes_and_out_names=[]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_2',
-                )
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), three_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(3))
-
-    def test_two_edges_on_same_field_in_chain(self):
-        query_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                in_Animal_Creature {
-                  name @output(out_name: "name")
-                  out_Animal_Critter {
-                    size @output(out_name: "size")
-                  }
-                }
-              }
-            }
-        ''')
-        parent_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        child1_str = dedent('''\
-            {
-              Animal {
-                name @output(out_name: "name")
-                uuid @output(out_name: "__intermediate_output_1")
-              }
-            }
-        ''')
-
-        child2_str = dedent('''\
-            {
-              Critter {
-                size @output(out_name: "size")
-                ID @output(out_name: "__intermediate_output_2")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=parent_str,
-            schema_id='second',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=child1_str,
-                        schema_id='first',
-                        child_query_nodes_and_out_names=[
-                            (
-                                ExpectedQueryNode(
-                                    query_str=child2_str,
-                                    schema_id='third',
-                                    child_query_nodes_and_out_names=[]
-                                ),
-                                '__intermediate_output_1',
-                                '__intermediate_output_2',
-                            )
-                        ]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                ),
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), three_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(3))
-
-    def test_complex_query_structure(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                color @output(out_name: "color")
-                out_Animal_Creature {
-                  age @output(out_name: "age")
-                  in_Animal_Creature {
-                    description @output(out_name: "description")
-                  }
-                  friend {
-                    in_Animal_Creature {
-                      description @output(out_name: "friend_description")
-                    }
-                  }
-                }
-              }
-            }
-        ''')
-        query_piece1_str = dedent('''\
-            {
-              Animal {
-                color @output(out_name: "color")
-                uuid @output(out_name: "__intermediate_output_0")
-              }
-            }
-        ''')
-        query_piece2_str = dedent('''\
-            {
-              Creature {
-                age @output(out_name: "age")
-                id @output(out_name: "__intermediate_output_1")
-                friend {
-                  id @output(out_name: "__intermediate_output_3")
-                }
-              }
-            }
-        ''')
-        query_piece3_str = dedent('''\
-            {
-              Animal {
-                description @output(out_name: "description")
-                uuid @output(out_name: "__intermediate_output_2")
-              }
-            }
-        ''')
-        query_piece4_str = dedent('''\
-            {
-              Animal {
-                description @output(out_name: "friend_description")
-                uuid @output(out_name: "__intermediate_output_4")
-              }
-            }
-        ''')
-        expected_query_node = ExpectedQueryNode(
-            query_str=query_piece1_str,
-            schema_id='first',
-            child_query_nodes_and_out_names=[
-                (
-                    ExpectedQueryNode(
-                        query_str=query_piece2_str,
-                        schema_id='second',
-                        child_query_nodes_and_out_names=[
-                            (
-                                ExpectedQueryNode(
-                                    query_str=query_piece3_str,
-                                    schema_id='first',
-                                    child_query_nodes_and_out_names=[]
-                                ),
-                                '__intermediate_output_1',
-                                '__intermediate_output_2',
-                            ),
-                            (
-                                ExpectedQueryNode(
-                                    query_str=query_piece4_str,
-                                    schema_id='first',
-                                    child_query_nodes_and_out_names=[]
-                                ),
-                                '__intermediate_output_3',
-                                '__intermediate_output_4',
-                            ),
-                        ]
-                    ),
-                    '__intermediate_output_0',
-                    '__intermediate_output_1',
-                ),
-            ]
-        )
-        query_node, intermediate_outputs = split_query(parse(query_str), basic_merged_schema)
-        self._check_query_node_structure(query_node, expected_query_node)
-        self.assertEqual(intermediate_outputs, self._get_intermediate_outputs_set(5))
+          }
+        }
+    '''),
+)
 
 
 class TestSplitQueryInvalidQuery(unittest.TestCase):
-    def test_invalid_query_unsupported_directives(self):
-        query_str = dedent('''\
-            {
-              Animal {
-                color @tag(tag_name: "color")
-                out_Animal_ParentOf {
-                  color @filter(op_name: "=", value: ["%color"])
-                        @output(out_name: "result")
-                }
-              }
-            }
-        ''')
-        with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
-
-        query_str = dedent('''\
-            {
-              Animal @fold {
-                color @output(out_name: "result")
-              }
-            }
-        ''')
-        with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
+    @classmethod
+    def setUpClass(cls):
+        """Bind the merged schemas once for all tests."""
+        cls.basic_merged_schema = get_basic_merged_schema()
+        cls.interface_merged_schema = get_interface_merged_schema()
 
-        query_str = dedent('''\
-            {
-              Animal {
-                out_Animal_ParentOf @recurse(depth: 1) {
-                  color @output(out_name: "result")
-                }
-              }
-            }
-        ''')
-        with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
+    def test_invalid_query_unsupported_directives(self):
+        for query_str in UNSUPPORTED_DIRECTIVES_QUERY_STRS:
+            with self.assertRaises(GraphQLValidationError):
+                split_query(parse(query_str), self.basic_merged_schema)
 
     def test_invalid_query_fails_builtin_validation(self):
         query_str = dedent('''\
@@ -1012,7 +1176,7 @@ class TestSplitQueryInvalidQuery(unittest.TestCase):
             }
         ''')
         with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
+            split_query(parse(query_str), self.basic_merged_schema)
 
     def test_invalid_query_wrong_field_order(self):
         query_str = dedent('''\
@@ -1026,7 +1190,7 @@ class TestSplitQueryInvalidQuery(unittest.TestCase):
             }
         ''')
         with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
+            split_query(parse(query_str), self.basic_merged_schema)
 
         query_str = dedent('''\
             {
@@ -1039,7 +1203,7 @@ class TestSplitQueryInvalidQuery(unittest.TestCase):
             }
         ''')
         with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), basic_merged_schema)
+            split_query(parse(query_str), self.basic_merged_schema)
 
     def test_invalid_query_inline_not_only_selection_in_scope(self):
         query_str = dedent('''\
@@ -1055,7 +1219,7 @@ class TestSplitQueryInvalidQuery(unittest.TestCase):
             }
         ''')
         with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), interface_merged_schema)
+            split_query(parse(query_str), self.interface_merged_schema)
 
         query_str = dedent('''\
             {
@@ -1072,4 +1236,4 @@ class TestSplitQueryInvalidQuery(unittest.TestCase):
             }
         ''')
         with self.assertRaises(GraphQLValidationError):
-            split_query(parse(query_str), interface_merged_schema)
+            split_query(parse(query_str), self.interface_merged_schema)
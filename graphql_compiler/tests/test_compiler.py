@@ -83,11 +83,12 @@ def check_test_data(
 
 
 class CompilerTests(unittest.TestCase):
-    def setUp(self):
-        """Disable max diff limits for all tests."""
-        self.maxDiff = None
-        self.schema = get_schema()
-        self.sql_schema_info = get_sqlalchemy_schema_info()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the test schemas once for all tests, and disable max diff limits."""
+        cls.maxDiff = None
+        cls.schema = get_schema()
+        cls.sql_schema_info = get_sqlalchemy_schema_info()
 
     def test_immediate_output(self):
         test_data = test_input_data.immediate_output()
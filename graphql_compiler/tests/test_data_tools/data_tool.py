@@ -59,14 +59,21 @@ def generate_redisgraph_integration_data(client):
 
 def _load_cypher_files_to_redisgraph_client(client, cypher_files):
     """Load list of supplied Cypher files into the supplied RedisGraph client."""
-    for filepath in cypher_files:
-        with open(filepath) as f:
-            for command in f.readlines():
-                sanitized_command = command.strip()
-                if len(sanitized_command) == 0 or sanitized_command[0] == '#':
-                    # comment or empty line, ignore
-                    continue
-                client.query(sanitized_command)
+    # Send all commands in a single round trip. The pipeline preserves command order, but unlike
+    # issuing the commands one at a time, it runs every queued command even if an earlier one
+    # fails. Raise the first error, if any, once all of them have run.
+    with client.redis_con.pipeline(transaction=False) as pipeline:
+        for filepath in cypher_files:
+            with open(filepath) as f:
+                for command in f.readlines():
+                    sanitized_command = command.strip()
+                    if len(sanitized_command) == 0 or sanitized_command[0] == '#':
+                        # comment or empty line, ignore
+                        continue
+                    pipeline.execute_command('GRAPH.QUERY', client.name, sanitized_command)
+        for response in pipeline.execute(raise_on_error=False):
+            if isinstance(response, Exception):
+                raise response
 
 
 def _load_sql_files_to_orient_client(client, sql_files):
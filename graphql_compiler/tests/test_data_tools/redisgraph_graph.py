@@ -1,17 +1,32 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 
-import redis
-from redisgraph import Graph
+from funcy import memoize
 
 
 REDISGRAPH_SERVER = 'localhost'
 REDISGRAPH_PORT = 6379
 
+# The redis and redisgraph packages are imported inside the functions below, since this module is
+# imported by conftest.py during every test collection while only the Redisgraph integration tests
+# actually need them.
+
+
+@memoize
+def _get_redis_connection_pool():
+    """Return the connection pool shared by all Redis clients created for testing."""
+    import redis
+
+    return redis.ConnectionPool(host=REDISGRAPH_SERVER, port=REDISGRAPH_PORT)
+
 
 def get_test_redisgraph_graph(graph_name, generate_data_func):
     """Generate the test database and return the Redisgraph client."""
-    # note redis_client is a Redis client, not a Redisgraph client
-    redis_client = redis.Redis(host=REDISGRAPH_SERVER, port=REDISGRAPH_PORT)
+    import redis
+    from redisgraph import Graph
+
+    # note redis_client is a Redis client, not a Redisgraph client. Its connections come from a
+    # shared pool, so retried calls reuse any connection already established to the server.
+    redis_client = redis.Redis(connection_pool=_get_redis_connection_pool())
 
     graph_client = Graph(graph_name, redis_client)  # connect to the graph itself
     generate_data_func(graph_client)
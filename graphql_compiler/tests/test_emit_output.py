@@ -25,10 +25,11 @@ from .test_helpers import (
 
 
 class EmitMatchTests(unittest.TestCase):
-    def setUp(self):
-        """Disable max diff limits for all tests."""
-        self.maxDiff = None
-        self.schema_info = get_common_schema_info()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the test schema info once for all tests, and disable max diff limits."""
+        cls.maxDiff = None
+        cls.schema_info = get_common_schema_info()
 
     def test_simple_immediate_output(self):
         # corresponds to:
@@ -201,10 +202,11 @@ class EmitMatchTests(unittest.TestCase):
 
 
 class EmitGremlinTests(unittest.TestCase):
-    def setUp(self):
-        """Disable max diff limits for all tests."""
-        self.maxDiff = None
-        self.schema_info = get_common_schema_info()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the test schema info once for all tests, and disable max diff limits."""
+        cls.maxDiff = None
+        cls.schema_info = get_common_schema_info()
 
     def test_simple_immediate_output(self):
         # corresponds to:
@@ -418,10 +420,11 @@ class EmitCypherTests(unittest.TestCase):
     like `GraphQLObjectType(name='Foo', fields={'name': GraphQLString}` instead. This is useful if
     we need to compare two LocationInfo objects because equality comparison compares references.
     """
-    def setUp(self):
-        """Disable max diff limits for all tests."""
-        self.maxDiff = None
-        self.schema_info = get_common_schema_info()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the test schema info once for all tests, and disable max diff limits."""
+        cls.maxDiff = None
+        cls.schema_info = get_common_schema_info()
 
     def test_simple_immediate_output(self):
         # corresponds to:
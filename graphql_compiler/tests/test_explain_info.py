@@ -14,9 +14,10 @@ from .test_helpers import get_schema
 class ExplainInfoTests(unittest.TestCase):
     """Ensure we get correct information about filters and recursion."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Initialize the test schema once for all tests."""
-        self.schema = get_schema()
+        cls.schema = get_schema()
 
     def compare_output_info(self, expected, received):
         """Compare two OutputInfo objects, using proper GraphQL type comparison operators."""
@@ -26,7 +26,7 @@ from ..schema_generation.utils import amend_custom_scalar_types
 
 # The strings which we will be comparing have newlines and spaces we'd like to get rid of,
 # so we can compare expected and produced emitted code irrespective of whitespace.
-WHITESPACE_PATTERN = re.compile(u'[\t\n ]*', flags=re.UNICODE)
+WHITESPACE_PATTERN = re.compile(u'[\t\n ]+', flags=re.UNICODE)
 
 # flag to indicate a test component should be skipped
 SKIP_TEST = 'SKIP'
@@ -188,10 +188,11 @@ def compute_child_and_revisit_locations(ir_blocks):
 class IrGenerationTests(unittest.TestCase):
     """Ensure valid inputs produce correct IR."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Initialize the test schema once for all tests, and disable max diff limits."""
-        self.maxDiff = None
-        self.schema = get_schema()
+        cls.maxDiff = None
+        cls.schema = get_schema()
 
     def test_immediate_output(self):
         test_data = test_input_data.immediate_output()
@@ -14,10 +14,11 @@ from .test_helpers import get_schema
 class IrGenerationErrorTests(unittest.TestCase):
     """Ensure illegal inputs raise proper exceptions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Initialize the test schema once for all tests, and disable max diff limits."""
-        self.maxDiff = None
-        self.schema = get_schema()
+        cls.maxDiff = None
+        cls.schema = get_schema()
 
     def test_repeated_field_name(self):
         repeated_property_field = '''{
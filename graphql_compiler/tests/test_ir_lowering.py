@@ -43,10 +43,11 @@ def check_test_data(test_case, expected_object, received_object):
 
 
 class CommonIrLoweringTests(unittest.TestCase):
-    def setUp(self):
-        """Disable max diff limits for all tests."""
-        self.maxDiff = None
-        self.schema = get_schema()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize the test schema once for all tests, and disable max diff limits."""
+        cls.maxDiff = None
+        cls.schema = get_schema()
 
     def test_optimize_boolean_expression_comparisons(self):
         base_location = Location(('Animal',))
@@ -8,9 +8,10 @@ from .test_helpers import get_schema
 class SubclassTests(unittest.TestCase):
     """Ensure we correctly compute subclass sets."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Initialize the test schema once for all tests."""
-        self.schema = get_schema()
+        cls.schema = get_schema()
 
     def test_compute_subclass_sets(self):
         type_equivalence_hints = {